@@ -2,6 +2,7 @@ from flask import Flask, render_template, request, jsonify
 import pandas as pd
 import numpy as np
 from house_price_model import HousePricePredictor
+from prediction_batcher import PredictionBatcher
 import os
 
 app = Flask(__name__)
@@ -22,6 +23,15 @@ else:
         predictor.train_model(X, y)
         predictor.save_model(model_path)
 
+# Optionally coalesce concurrent /predict calls into batched model calls
+batcher = None
+if os.environ.get('PREDICT_BATCHING', '0') == '1':
+    batcher = PredictionBatcher(
+        predictor,
+        window_ms=float(os.environ.get('PREDICT_BATCH_WINDOW_MS', 2)),
+        max_batch_size=int(os.environ.get('PREDICT_MAX_BATCH_SIZE', 32))
+    )
+
 # Get unique addresses for dropdown
 df = pd.read_csv(csv_path)
 unique_addresses = sorted(df['Address'].unique().tolist())
@@ -166,7 +176,10 @@ def predict():
         }
         
         # Make prediction
-        prediction = predictor.predict(features)
+        if batcher is not None:
+            prediction = batcher.predict(features)
+        else:
+            prediction = predictor.predict(features)
         
         if prediction is not None:
             # Convert to USD (assuming 1 USD = 30,000 Toman)
@@ -190,6 +203,16 @@ def predict():
             'error': str(e)
         })
 
+@app.route('/api/batch-stats')
+def get_batch_stats():
+    """Get prediction batching metrics"""
+    if batcher is None:
+        return jsonify({'enabled': False})
+    
+    stats = batcher.stats()
+    stats['enabled'] = True
+    return jsonify(stats)
+
 @app.route('/api/stats')
 def get_stats():
     """Get dataset statistics"""
@@ -168,35 +168,40 @@ class HousePricePredictor:
             print(f"Error in model training: {str(e)}")
             return False
     
+    def _prepare_features(self, features):
+        """Convert a feature list or dict into a single unscaled row"""
+        # Convert to DataFrame if it's a list
+        if isinstance(features, list):
+            return np.array(features).reshape(1, -1)
+        elif isinstance(features, dict):
+            # Convert dict to array in correct order
+            feature_array = []
+            for feature_name in self.feature_names:
+                if feature_name == 'Total_amenities':
+                    # Calculate total amenities
+                    total = features.get('Parking', 0) + features.get('Warehouse', 0) + features.get('Elevator', 0)
+                    feature_array.append(total)
+                elif feature_name == 'Address_encoded':
+                    # Encode address
+                    address = features.get('Address', '')
+                    try:
+                        encoded = self.label_encoder.transform([address])[0]
+                    except:
+                        # If address not seen before, use most common encoding
+                        encoded = 0
+                    feature_array.append(encoded)
+                else:
+                    feature_array.append(features.get(feature_name, 0))
+            return np.array(feature_array).reshape(1, -1)
+        return features
+    
     def predict(self, features):
         """Make prediction for new data"""
         if not self.is_trained:
             raise ValueError("Model is not trained yet!")
         
         try:
-            # Convert to DataFrame if it's a list
-            if isinstance(features, list):
-                features = np.array(features).reshape(1, -1)
-            elif isinstance(features, dict):
-                # Convert dict to array in correct order
-                feature_array = []
-                for feature_name in self.feature_names:
-                    if feature_name == 'Total_amenities':
-                        # Calculate total amenities
-                        total = features.get('Parking', 0) + features.get('Warehouse', 0) + features.get('Elevator', 0)
-                        feature_array.append(total)
-                    elif feature_name == 'Address_encoded':
-                        # Encode address
-                        address = features.get('Address', '')
-                        try:
-                            encoded = self.label_encoder.transform([address])[0]
-                        except:
-                            # If address not seen before, use most common encoding
-                            encoded = 0
-                        feature_array.append(encoded)
-                    else:
-                        feature_array.append(features.get(feature_name, 0))
-                features = np.array(feature_array).reshape(1, -1)
+            features = self._prepare_features(features)
             
             # Scale features if using LinearRegression
             if isinstance(self.model, LinearRegression):
@@ -209,6 +214,26 @@ class HousePricePredictor:
             print(f"Error in prediction: {str(e)}")
             return None
     
+    def predict_batch(self, features_list):
+        """Make predictions for several inputs with a single model call"""
+        if not self.is_trained:
+            raise ValueError("Model is not trained yet!")
+        
+        try:
+            features = np.vstack([self._prepare_features(f) for f in features_list])
+            
+            # Scale features if using LinearRegression
+            if isinstance(self.model, LinearRegression):
+                features = self.scaler.transform(features)
+            
+            predictions = self.model.predict(features)
+            return [max(0, prediction) for prediction in predictions]  # Ensure non-negative prices
+            
+        except Exception as e:
+            # Score rows one by one so a single bad input does not fail the whole batch
+            print(f"Error in batch prediction: {str(e)}")
+            return [self.predict(f) for f in features_list]
+    
     def save_model(self, filepath):
         """Save the trained model"""
         if not self.is_trained:
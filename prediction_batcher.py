@@ -0,0 +1,126 @@
+import queue
+import threading
+import time
+
+
+class _PendingPrediction:
+    """A single caller waiting for its slot in a batch"""
+
+    def __init__(self, features):
+        self.features = features
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+
+
+class PredictionBatcher:
+    """Coalesce concurrent predictions into batched model calls.
+
+    Requests arriving within ``window_ms`` of each other (up to
+    ``max_batch_size`` of them) are scored together with
+    ``predictor.predict_batch``. When nothing else is outstanding the call
+    goes straight to ``predictor.predict`` so an idle server pays no
+    batching delay.
+    """
+
+    def __init__(self, predictor, window_ms=2.0, max_batch_size=32):
+        self.predictor = predictor
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, int(max_batch_size))
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._worker = None
+
+        # Metrics
+        self._direct_calls = 0
+        self._batches = 0
+        self._batched_requests = 0
+        self._max_batch_size_seen = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def predict(self, features):
+        """Predict a single input, batching it with concurrent callers"""
+        with self._lock:
+            direct = self._outstanding == 0
+            self._outstanding += 1
+
+        try:
+            if direct:
+                with self._lock:
+                    self._direct_calls += 1
+                return self.predictor.predict(features)
+
+            self._ensure_worker()
+            pending = _PendingPrediction(features)
+            self._queue.put(pending)
+            pending.done.wait()
+            return pending.result
+        finally:
+            with self._lock:
+                self._outstanding -= 1
+
+    def stats(self):
+        """Get batch size and queue wait metrics"""
+        with self._lock:
+            batches = self._batches
+            requests = self._batched_requests
+            return {
+                'window_ms': self.window * 1000.0,
+                'max_batch_size': self.max_batch_size,
+                'direct_calls': self._direct_calls,
+                'batches': batches,
+                'batched_requests': requests,
+                'avg_batch_size': requests / batches if batches else 0.0,
+                'max_batch_size_seen': self._max_batch_size_seen,
+                'avg_queue_wait_ms': self._total_wait / requests * 1000.0 if requests else 0.0,
+                'max_queue_wait_ms': self._max_wait * 1000.0
+            }
+
+    def _ensure_worker(self):
+        """Start the background batching thread on first use"""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name='prediction-batcher', daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self.window
+
+            # Collect requests until the window closes or the batch is full
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._score(batch)
+
+    def _score(self, batch):
+        started = time.perf_counter()
+        try:
+            results = self.predictor.predict_batch([p.features for p in batch])
+        except Exception as e:
+            print(f"Error in batched prediction: {str(e)}")
+            results = [None] * len(batch)
+
+        waits = [started - p.enqueued_at for p in batch]
+        with self._lock:
+            self._batches += 1
+            self._batched_requests += len(batch)
+            self._max_batch_size_seen = max(self._max_batch_size_seen, len(batch))
+            self._total_wait += sum(waits)
+            self._max_wait = max(self._max_wait, max(waits))
+
+        for pending, result in zip(batch, results):
+            pending.result = result
+            pending.done.set()